@@ -15,7 +15,21 @@ DIVIDER_STR = "[bold yellow]═" * 40 + "[/bold yellow]"
 console = Console()
 
 console.print("[bold cyan]Loading NYC Parks GeoJSON...[/bold cyan]")
-gdf = gpd.read_file(SOURCE_DATA_FILE)
+gdf = gpd.read_file(SOURCE_DATA_FILE, engine="pyogrio", use_arrow=True)
+
+# Counted and grouped columns have few distinct values, store them as categoricals
+# (categories in order of first appearance, like the plain column's value_counts)
+for column in ("typecategory", "subcategory", "borough"):
+    if column in gdf.columns:
+        gdf[column] = gdf[column].astype(
+            pd.CategoricalDtype(gdf[column].dropna().unique())
+        )
+
+
+def sorted_value_counts(series):
+    """Value counts in descending order, with ties in order of first appearance."""
+    return series.value_counts(sort=False).sort_values(ascending=False, kind="stable")
+
 
 console.print("\n" + DIVIDER_STR)
 console.print("[bold yellow]BASIC DATASET INFORMATION[/bold yellow]")
@@ -29,7 +43,7 @@ console.print("[bold yellow]TYPECATEGORY DISTRIBUTION[/bold yellow]")
 console.print(DIVIDER_STR + "\n")
 
 if "typecategory" in gdf.columns:
-    typecategory_counts = gdf["typecategory"].value_counts()
+    typecategory_counts = sorted_value_counts(gdf["typecategory"])
 
     table = Table(title="Park Types", show_header=True, header_style="bold magenta")
     table.add_column("Type Category", style="cyan", no_wrap=True)
@@ -51,7 +65,7 @@ console.print("[bold yellow]SUBCATEGORY DISTRIBUTION[/bold yellow]")
 console.print(DIVIDER_STR + "\n")
 
 if "subcategory" in gdf.columns:
-    subcategory_counts = gdf["subcategory"].value_counts().head(20)
+    subcategory_counts = sorted_value_counts(gdf["subcategory"]).head(20)
 
     table = Table(
         title="Park Subcategories (Top 20)",
@@ -77,12 +91,13 @@ console.print("[bold yellow]BOROUGH DISTRIBUTION[/bold yellow]")
 console.print(DIVIDER_STR + "\n")
 
 if "borough" in gdf.columns:
-    borough_counts = gdf["borough"].value_counts()
-
     if "acres" in gdf.columns:
         gdf["acres_numeric"] = pd.to_numeric(gdf["acres"], errors="coerce")
-        borough_acres = (
-            gdf.groupby("borough")["acres_numeric"].sum().sort_values(ascending=False)
+        # Park count and total acres per borough in a single groupby
+        borough_stats = (
+            gdf.groupby("borough", observed=True)
+            .agg(count=("borough", "size"), acres=("acres_numeric", "sum"))
+            .sort_values("acres", ascending=False)
         )
 
         table = Table(
@@ -92,9 +107,7 @@ if "borough" in gdf.columns:
         table.add_column("Park Count", justify="right", style="green")
         table.add_column("Total Acres", justify="right", style="yellow")
 
-        for borough in borough_acres.index:
-            count = borough_counts.get(borough, 0)
-            acres = borough_acres.get(borough, 0)
+        for borough, count, acres in borough_stats.itertuples():
             table.add_row(str(borough), str(count), f"{acres:,.2f}")
 
         console.print(table)
@@ -105,6 +118,7 @@ if "borough" in gdf.columns:
         table.add_column("Borough", style="cyan")
         table.add_column("Count", justify="right", style="green")
 
+        borough_counts = sorted_value_counts(gdf["borough"])
         for borough, count in borough_counts.items():
             table.add_row(str(borough), str(count))
 
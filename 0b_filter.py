@@ -4,41 +4,53 @@ Filter the parks dataset based on specified criteria (e.g., typecategory whiteli
 """
 
 import geopandas as gpd
+import numpy as np
 import os
+import pyogrio
 
 print("Loading NYC Parks GeoJSON...")
 SOURCE_DATA_FILE = "./source_data/Parks_Properties_20251021_modified.geojson"
-OUTPUT_DATA_FILE = "./output_data/0b_parks_filtered.geojson"
+OUTPUT_DATA_FILE = "./output_data/0b_parks_filtered.parquet"
 OUTPUT_DATA_FILE_REMOVED = "./output_data/0b_parks_filtered_removed.geojson"
 
-gdf = gpd.read_file(SOURCE_DATA_FILE)
+gdf = gpd.read_file(SOURCE_DATA_FILE, engine="pyogrio", use_arrow=True)
+gdf["typecategory"] = gdf["typecategory"].astype("category")
 
 print(f"Total parks before filtering: {len(gdf)}")
 
 # Exluced typecategories are:
 # "Lot", "Strip", 'Operations", "Retired N/A", "Parkway", "Mall", "Undeveloped"
 # Filter by typecategory whitelist
-TYPECATEGORY_WHITELIST = [
-    "Triangle/Plaza",
-    "Garden",
-    "Neighborhood Park",
-    "Jointly Operated Playground",
-    "Playground",
-    "Community Park",
-    "Nature Area",
-    "Recreational Field/Courts",
-    "Waterfront Facility",
-    "Flagship Park",
-    "Managed Sites",
-    "Historic House Park",
-    "Cemetery",
-]
+TYPECATEGORY_WHITELIST = frozenset(
+    [
+        "Triangle/Plaza",
+        "Garden",
+        "Neighborhood Park",
+        "Jointly Operated Playground",
+        "Playground",
+        "Community Park",
+        "Nature Area",
+        "Recreational Field/Courts",
+        "Waterfront Facility",
+        "Flagship Park",
+        "Managed Sites",
+        "Historic House Park",
+        "Cemetery",
+    ]
+)
 
 
-filter_mask = gdf["typecategory"].isin(TYPECATEGORY_WHITELIST)
+# Match the whitelist against the category codes instead of the strings
+typecategories = gdf["typecategory"].cat.categories
+allowed_codes = [
+    code
+    for code, typecategory in enumerate(typecategories)
+    if typecategory in TYPECATEGORY_WHITELIST
+]
+filter_mask = np.isin(gdf["typecategory"].cat.codes.to_numpy(), allowed_codes)
 
 gdf_filtered = gdf[filter_mask]
-gdf_filtered_out = gdf[~gdf.index.isin(gdf_filtered.index)]
+gdf_filtered_out = gdf[~filter_mask]
 
 print(f"Total parks after filtering (kept): {len(gdf_filtered)}")
 print(f"Total parks filtered out (removed): {len(gdf_filtered_out)}")
@@ -46,12 +58,14 @@ print(f"Total parks filtered out (removed): {len(gdf_filtered_out)}")
 # Create data directory if it doesn't exist
 os.makedirs("data", exist_ok=True)
 
-# Save filtered data (kept)
+# Save filtered data (kept) as GeoParquet, only 0c_basic_augment.py reads it
 print(f"\nSaving filtered data to {OUTPUT_DATA_FILE}...")
-gdf_filtered.to_file(OUTPUT_DATA_FILE, driver="GeoJSON")
+gdf_filtered.to_parquet(OUTPUT_DATA_FILE, index=False)
 
 # Save filtered-out data (removed)
 print(f"Saving filtered-out data to {OUTPUT_DATA_FILE_REMOVED}...")
-gdf_filtered_out.to_file(OUTPUT_DATA_FILE_REMOVED, driver="GeoJSON")
+pyogrio.write_dataframe(
+    gdf_filtered_out, OUTPUT_DATA_FILE_REMOVED, driver="GeoJSON", use_arrow=True
+)
 
 print("\nDone!")
@@ -4,45 +4,36 @@ Add geometric calculations and analysis fields to the filtered parks dataset
 """
 
 import geopandas as gpd
-import pyproj
-from shapely.ops import transform
-from shapely.geometry import mapping
+import numpy as np
+import pyogrio
+import shapely
 
-print("Loading NYC Parks GeoJSON...")
-SOURCE_DATA_FILE = "./output_data/0b_parks_filtered.geojson"
+print("Loading filtered NYC Parks...")
+SOURCE_DATA_FILE = "./output_data/0b_parks_filtered.parquet"
 OUTPUT_DATA_FILE = "./output_data/0c_parks_filtered_augmented.geojson"
 
 # Load the filtered parks data
-gdf = gpd.read_file(SOURCE_DATA_FILE)
+gdf = gpd.read_parquet(SOURCE_DATA_FILE)
 print(f"Loaded {len(gdf)} parks")
 
 # Reproject to EPSG:32618 (UTM Zone 18N) for accurate measurements in meters
+# Only the geometry is needed for the measurements, so leave the attributes behind
 print("Reprojecting to EPSG:32618 (UTM Zone 18N) for accurate measurements...")
-gdf_proj = gdf.to_crs(epsg=32618)
+geom_proj = gdf.geometry.to_crs(epsg=32618)
 
 print("Calculating geometric properties...")
 
 # Core geometric measurements
-gdf["area_sqm"] = gdf_proj.geometry.area
-gdf["perimeter_m"] = gdf_proj.geometry.length
-gdf["num_vertices"] = gdf.geometry.apply(
-    lambda geom: (
-        len(geom.exterior.coords)
-        if geom.geom_type == "Polygon"
-        else (
-            sum(len(p.exterior.coords) for p in geom.geoms)
-            if geom.geom_type == "MultiPolygon"
-            else 0
-        )
-    )
-)
-gdf["num_polygons"] = gdf.geometry.apply(
-    lambda geom: (
-        1
-        if geom.geom_type == "Polygon"
-        else len(geom.geoms) if geom.geom_type == "MultiPolygon" else 0
-    )
-)
+gdf["area_sqm"] = geom_proj.area
+gdf["perimeter_m"] = geom_proj.length
+# Count exterior ring vertices of every part, then sum the parts per park
+parts, part_index = shapely.get_parts(gdf.geometry.values, return_index=True)
+gdf["num_vertices"] = np.bincount(
+    part_index,
+    weights=shapely.get_num_coordinates(shapely.get_exterior_ring(parts)),
+    minlength=len(gdf),
+).astype(int)
+gdf["num_polygons"] = shapely.get_num_geometries(gdf.geometry.values)
 
 # Centroid information
 centroid = gdf.geometry.centroid
@@ -50,70 +41,56 @@ gdf["centroid_lon"] = centroid.x
 gdf["centroid_lat"] = centroid.y
 
 # Bounding box dimensions and shape characteristics
-gdf["bbox_width"] = gdf_proj.geometry.apply(lambda g: g.bounds[2] - g.bounds[0])
-gdf["bbox_height"] = gdf_proj.geometry.apply(lambda g: g.bounds[3] - g.bounds[1])
+bounds = shapely.bounds(geom_proj.values)
+gdf["bbox_width"] = bounds[:, 2] - bounds[:, 0]
+gdf["bbox_height"] = bounds[:, 3] - bounds[:, 1]
 gdf["aspect_ratio"] = gdf["bbox_width"] / gdf["bbox_height"]
 
 # Convex hull analysis
 print("Calculating convex hulls...")
-gdf["convex_hull_area"] = gdf_proj.geometry.convex_hull.area
+gdf["convex_hull_area"] = geom_proj.convex_hull.area
 gdf["convexity_ratio"] = gdf["area_sqm"] / gdf["convex_hull_area"]
-# Store convex hull geometry as GeoJSON dict (using original WGS84 coordinates)
-gdf["convex_hull_polygon"] = gdf.geometry.convex_hull.apply(lambda geom: mapping(geom))
+# Store convex hull geometry as GeoJSON (using original WGS84 coordinates)
+gdf["convex_hull_polygon"] = shapely.to_geojson(
+    shapely.convex_hull(gdf.geometry.values)
+)
 
 
 # Multi-polygon analysis - individual polygon areas
-def get_polygon_areas_sorted(geom, projected_geom):
+def get_polygon_areas_sorted(projected_geom):
     """Extract areas of individual polygons in descending order."""
-    if geom.geom_type == "Polygon":
+    if projected_geom.geom_type == "Polygon":
         # Single polygon - return list with one area
         return [projected_geom.area]
-    elif geom.geom_type == "MultiPolygon":
-        # Multiple polygons - calculate area for each and sort descending
-        # Create transformer for this geometry
-        transformer = pyproj.Transformer.from_crs(
-            "EPSG:4326", "EPSG:32618", always_xy=True
-        )
-
-        # Get areas of all polygons
-        areas = []
-        for poly in geom.geoms:
-            # Transform to projected CRS for accurate area
-            poly_proj = transform(transformer.transform, poly)
-            areas.append(poly_proj.area)
-
-        # Sort in descending order
-        return sorted(areas, reverse=True)
+    elif projected_geom.geom_type == "MultiPolygon":
+        # Multiple polygons - the projected parts already measure in meters
+        return sorted((poly.area for poly in projected_geom.geoms), reverse=True)
     else:
         return []
 
 
 print("Calculating individual polygon areas...")
-gdf["polygon_areas_desc"] = gdf.apply(
-    lambda row: get_polygon_areas_sorted(
-        row.geometry, gdf_proj.loc[row.name, "geometry"]
-    ),
-    axis=1,
-)
-
-# Polygon area statistics
-gdf["largest_polygon_area"] = gdf["polygon_areas_desc"].apply(
-    lambda x: x[0] if len(x) > 0 else 0
-)
-gdf["smallest_polygon_area"] = gdf["polygon_areas_desc"].apply(
-    lambda x: x[-1] if len(x) > 0 else 0
-)
-gdf["polygon_area_ratio"] = gdf.apply(
-    lambda row: (
-        row["largest_polygon_area"] / row["smallest_polygon_area"]
-        if row["smallest_polygon_area"] > 0
-        else float("inf")
-    ),
-    axis=1,
-)
+gdf["polygon_areas_desc"] = [
+    get_polygon_areas_sorted(geom) for geom in geom_proj.values
+]
+
+# Polygon area statistics (largest, smallest and their ratio in a single pass)
+largest_areas = np.zeros(len(gdf))
+smallest_areas = np.zeros(len(gdf))
+area_ratios = np.full(len(gdf), np.inf)
+for i, areas in enumerate(gdf["polygon_areas_desc"].values):
+    if areas:
+        largest_areas[i] = areas[0]
+        smallest_areas[i] = areas[-1]
+        if areas[-1] > 0:
+            area_ratios[i] = areas[0] / areas[-1]
+
+gdf["largest_polygon_area"] = largest_areas
+gdf["smallest_polygon_area"] = smallest_areas
+gdf["polygon_area_ratio"] = area_ratios
 
 print("Saving augmented data...")
-gdf.to_file(OUTPUT_DATA_FILE, driver="GeoJSON")
+pyogrio.write_dataframe(gdf, OUTPUT_DATA_FILE, driver="GeoJSON", use_arrow=True)
 print(f"Saved to: {OUTPUT_DATA_FILE}")
 
 print("\nAdded the following fields:")
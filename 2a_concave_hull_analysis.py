@@ -3,13 +3,13 @@ NYC Parks Concave Hull Analysis
 Analyze geometric properties of the concave hulls for NYC parks
 """
 
-import json
 import math
 import geopandas as gpd
 import numpy as np
-from shapely import geometry
-from shapely.geometry import shape, mapping, Polygon
-from shapely.ops import transform
+import orjson
+import shapely
+from numba import njit
+from shapely.geometry import Polygon
 import pyproj
 
 print("Loading NYC Parks with Concave Hulls...")
@@ -17,107 +17,112 @@ SOURCE_DATA_FILE = "./output_data/1a_parks_with_concave_hulls.geojson"
 OUTPUT_DATA_FILE = "./output_data/2a_parks_concave_hull_analysis.geojson"
 
 # Load the parks data with concave hulls
-with open(SOURCE_DATA_FILE, "r") as f:
-    data = json.load(f)
+with open(SOURCE_DATA_FILE, "rb") as f:
+    data = orjson.loads(f.read())
 
 print(f"Loaded {len(data['features'])} parks")
 
-# Create transformer for accurate measurements in meters (WGS84 to UTM Zone 18N)
-transformer = pyproj.Transformer.from_crs("EPSG:4326", "EPSG:32618", always_xy=True)
+# Create inverse transformer for storing vertices in WGS84 (UTM Zone 18N to WGS84)
+transformer_inv = pyproj.Transformer.from_crs("EPSG:32618", "EPSG:4326", always_xy=True)
 
-# MARK: Circle Analysis - Compactness Metrics
+# MARK: Helpers (geometry kernels are compiled with Numba)
 
-print("\nCalculating circle analysis (compactness metrics)...")
 
-for feature in data["features"]:
-    properties = feature["properties"]
+@njit(cache=True)
+def ring_edge_lengths(ring_coords):
+    """Lengths of the edges of a closed (N, 2) coordinate ring (last == first)."""
+    num_edges = ring_coords.shape[0] - 1
+    lengths = np.empty(max(num_edges, 0))
+    for i in range(num_edges):
+        dx = ring_coords[i + 1, 0] - ring_coords[i, 0]
+        dy = ring_coords[i + 1, 1] - ring_coords[i, 1]
+        lengths[i] = math.sqrt(dx * dx + dy * dy)
+    return lengths
 
-    # Get the concave hull polygon
-    concave_hull_dict = properties.get("concave_hull_polygon")
-    if not concave_hull_dict:
-        # Skip if no concave hull
-        properties["circle_analysis"] = None
-        continue
 
-    # Initialize circle analysis dictionary
-    circle_analysis = {}
+@njit(cache=True)
+def edge_rotation_degrees(ring_coords, edge_index):
+    """Angle of a ring edge counterclockwise from east, normalized to [0, 180)."""
+    dx = ring_coords[edge_index + 1, 0] - ring_coords[edge_index, 0]
+    dy = ring_coords[edge_index + 1, 1] - ring_coords[edge_index, 1]
+    rotation_degrees = math.degrees(math.atan2(dy, dx))
 
-    # Convert to shapely geometry
-    concave_hull = shape(concave_hull_dict)
+    # Rectangles have 180-degree symmetry
+    if rotation_degrees < 0:
+        rotation_degrees += 180
+    elif rotation_degrees >= 180:
+        rotation_degrees -= 180
+    return rotation_degrees
 
-    # Project to UTM for accurate metric measurements
-    concave_hull_proj = transform(transformer.transform, concave_hull)
 
-    # Calculate area and perimeter of concave hull
-    ch_area = concave_hull_proj.area
-    ch_perimeter = concave_hull_proj.length
+def bisect_tolerance(min_tolerance, max_tolerance, tolerance, num_vertices):
+    """Narrow the Douglas-Peucker tolerance range towards exactly 3 vertices."""
+    if num_vertices > 3:
+        # Need more simplification (higher tolerance)
+        min_tolerance = tolerance
+    else:
+        # Too much simplification (lower tolerance)
+        max_tolerance = tolerance
+    return (min_tolerance + max_tolerance) / 2, min_tolerance, max_tolerance
+
+
+def optional_float(value):
+    """Convert a NaN metric to None (null in the output), otherwise to a float."""
+    return None if np.isnan(value) else float(value)
+
 
-    circle_analysis["ch_area_sqm"] = ch_area
-    circle_analysis["ch_perimeter_m"] = ch_perimeter
+# MARK: Circle Analysis - Compactness Metrics
+
+print("\nCalculating circle analysis (compactness metrics)...")
 
+# Every analysis below is kept as one array per metric (NaN where it is not
+# defined) and only turned into per-park dicts when the results are saved
+
+# Parse all concave hulls (None where missing) in one GEOS call and project them
+# to UTM in a single call for accurate metric measurements. The projected hulls
+# are shared by all three analyses below
+concave_hulls = gpd.GeoSeries(
+    shapely.from_geojson(
+        [
+            (
+                orjson.dumps(feature["properties"]["concave_hull_polygon"])
+                if feature["properties"].get("concave_hull_polygon")
+                else None
+            )
+            for feature in data["features"]
+        ]
+    ),
+    crs="EPSG:4326",
+)
+concave_hulls_proj = concave_hulls.to_crs(epsg=32618).values
+has_concave_hull = ~shapely.is_missing(concave_hulls_proj)
+num_features = len(concave_hulls_proj)
+
+# Calculate area and perimeter of all concave hulls
+ch_areas = shapely.area(concave_hulls_proj)
+ch_perimeters = shapely.length(concave_hulls_proj)
+
+with np.errstate(divide="ignore", invalid="ignore"):
     # Polsby-Popper Compactness: 4π * Area / Perimeter²
     # Ranges from 0 to 1, where 1 is a perfect circle
-    if ch_perimeter > 0:
-        polsby_popper = (4 * math.pi * ch_area) / (ch_perimeter**2)
-        circle_analysis["polsby_popper"] = polsby_popper
-    else:
-        circle_analysis["polsby_popper"] = None
+    polsby_popper = np.where(
+        ch_perimeters > 0, (4 * np.pi * ch_areas) / (ch_perimeters**2), np.nan
+    )
 
     # Schwartzberg Compactness (Reciprocal of Reock): Perimeter / (2π√(Area/π))
     # Equal to 1 for a circle, increases for less compact shapes
-    if ch_area > 0:
-        schwartzberg = ch_perimeter / (2 * math.pi * math.sqrt(ch_area / math.pi))
-        circle_analysis["schwartzberg"] = schwartzberg
-    else:
-        circle_analysis["schwartzberg"] = None
+    schwartzberg = np.where(
+        ch_areas > 0, ch_perimeters / (2 * np.pi * np.sqrt(ch_areas / np.pi)), np.nan
+    )
 
-    # Reock Compactness: Area / Area of minimum bounding circle
-    # The minimum bounding circle is calculated from the convex hull
-    try:
-        # Get the minimum bounding circle (available in shapely 2.0+)
-        min_circle = concave_hull_proj.minimum_bounding_circle()
-        min_circle_area = min_circle.area
-    except AttributeError:
-        # Fallback: use convex hull's minimum bounding circle
-        # or approximate using the envelope
-        convex_hull = concave_hull_proj.convex_hull
-        # Use the circumradius of the convex hull as approximation
-        # Get the bounds and calculate the diagonal
-        bounds = convex_hull.bounds
-        center_x = (bounds[0] + bounds[2]) / 2
-        center_y = (bounds[1] + bounds[3]) / 2
-
-        # Find the maximum distance from center to any vertex
-        if isinstance(convex_hull, Polygon):
-            coords = list(convex_hull.exterior.coords)
-        else:
-            coords = []
-
-        max_dist = 0
-        for x, y in coords:
-            dist = math.sqrt((x - center_x) ** 2 + (y - center_y) ** 2)
-            if dist > max_dist:
-                max_dist = dist
-
-        # Area of circle with this radius
-        min_circle_area = math.pi * (max_dist**2) if max_dist > 0 else 0
-
-    if min_circle_area > 0:
-        reock_compactness = ch_area / min_circle_area
-        circle_analysis["reock_compactness"] = reock_compactness
-
-        # Calculate the radius of the circumscribed circle
-        # Area = π * r², so r = √(Area/π)
-        circumscribed_radius = math.sqrt(min_circle_area / math.pi)
-        circle_analysis["circumscribed_circle_radius"] = circumscribed_radius
-        circle_analysis["circumscribed_circle_area"] = min_circle_area
-    else:
-        circle_analysis["reock_compactness"] = None
-        circle_analysis["circumscribed_circle_radius"] = None
-        circle_analysis["circumscribed_circle_area"] = None
+    # Radius of the circumscribed (minimum bounding) circle, measured exactly
+    # rather than from the area of its polygonal approximation
+    circumscribed_radii = shapely.minimum_bounding_radius(concave_hulls_proj)
+    circumscribed_radii = np.where(circumscribed_radii > 0, circumscribed_radii, np.nan)
 
-    # Store circle analysis in properties
-    properties["circle_analysis"] = circle_analysis
+    # Reock Compactness: Area / Area of minimum bounding circle
+    min_circle_areas = np.pi * circumscribed_radii**2
+    reock_compactness = ch_areas / min_circle_areas
 
 print(f"  Added circle analysis fields:")
 print(f"    - ch_area_sqm: Concave hull area in square meters")
@@ -132,107 +137,71 @@ print(f"    - circumscribed_circle_area: Area of minimum bounding circle (m²)")
 
 print("\nCalculating rectangularity analysis (minimum rotated rectangle)...")
 
-for feature in data["features"]:
-    properties = feature["properties"]
-
-    # Get the concave hull polygon
-    concave_hull_dict = properties.get("concave_hull_polygon")
-    if not concave_hull_dict:
-        # Skip if no concave hull
-        properties["rectangularity_analysis"] = None
-        continue
-
-    # Initialize rectangularity analysis dictionary
-    rectangularity_analysis = {}
-
-    # Convert to shapely geometry
-    concave_hull = shape(concave_hull_dict)
-
-    # Project to UTM for accurate metric measurements
-    concave_hull_proj = transform(transformer.transform, concave_hull)
 
+def analyze_rectangularity(concave_hull_proj):
+    """Minimum rotated rectangle metrics of one concave hull (NaN where undefined)."""
     # Calculate minimum rotated rectangle
     mrr = concave_hull_proj.minimum_rotated_rectangle
 
     # Get the vertices of the minimum rotated rectangle in UTM
     mrr_coords_utm = list(mrr.exterior.coords)
 
-    # Transform vertices back to WGS84 for storage
-    transformer_inv = pyproj.Transformer.from_crs(
-        "EPSG:32618", "EPSG:4326", always_xy=True
-    )
-    mrr_coords_wgs84 = [
-        list(transformer_inv.transform(x, y)) for x, y in mrr_coords_utm
-    ]
-    rectangularity_analysis["mrr_vertices"] = mrr_coords_wgs84
+    # Transform vertices back to WGS84 for storage (all vertices in one call)
+    mrr_xy_utm = np.asarray(mrr_coords_utm, dtype=float).reshape(-1, 2)
+    mrr_lons, mrr_lats = transformer_inv.transform(mrr_xy_utm[:, 0], mrr_xy_utm[:, 1])
+    mrr_coords_wgs84 = np.column_stack((mrr_lons, mrr_lats)).tolist()
 
     # Calculate width and height
     # The MRR has 5 coordinates (last == first), so we have 4 unique vertices
-    coords = mrr_coords_utm[:-1]  # Remove duplicate last point
-
-    if len(coords) >= 4:
-        # Calculate edge lengths
-        edge1 = math.sqrt(
-            (coords[1][0] - coords[0][0]) ** 2 + (coords[1][1] - coords[0][1]) ** 2
-        )
-        edge2 = math.sqrt(
-            (coords[2][0] - coords[1][0]) ** 2 + (coords[2][1] - coords[1][1]) ** 2
-        )
-
-        # Width is the longer edge, height is the shorter
-        mrr_width = max(edge1, edge2)
-        mrr_height = min(edge1, edge2)
-
-        rectangularity_analysis["mrr_width"] = mrr_width
-        rectangularity_analysis["mrr_height"] = mrr_height
-
-        # Calculate rotation angle (angle of the longer edge from horizontal)
-        # Determine which edge is the width
-        if edge1 > edge2:
-            dx = coords[1][0] - coords[0][0]
-            dy = coords[1][1] - coords[0][1]
-        else:
-            dx = coords[2][0] - coords[1][0]
-            dy = coords[2][1] - coords[1][1]
-
-        # Calculate angle in degrees (counterclockwise from east/positive x-axis)
-        rotation_radians = math.atan2(dy, dx)
-        rotation_degrees = math.degrees(rotation_radians)
-
-        # Normalize to [0, 180) since rectangles have 180-degree symmetry
-        if rotation_degrees < 0:
-            rotation_degrees += 180
-        elif rotation_degrees >= 180:
-            rotation_degrees -= 180
-
-        rectangularity_analysis["mrr_rotation_degrees"] = rotation_degrees
-    else:
-        rectangularity_analysis["mrr_width"] = None
-        rectangularity_analysis["mrr_height"] = None
-        rectangularity_analysis["mrr_rotation_degrees"] = None
-
-    # Calculate area of MRR
-    mrr_area = mrr.area
-    rectangularity_analysis["mrr_area_sqm"] = mrr_area
+    if len(mrr_xy_utm) < 5:
+        return mrr_coords_wgs84, np.nan, np.nan, np.nan, mrr.area
 
+    # Calculate edge lengths
+    edge_lengths = ring_edge_lengths(mrr_xy_utm)
+
+    # Width is the longer of two adjacent edges, height is the shorter
+    long_edge = 0 if edge_lengths[0] > edge_lengths[1] else 1
+    mrr_width = edge_lengths[long_edge]
+    mrr_height = edge_lengths[1 - long_edge]
+
+    # Calculate rotation angle (angle of the longer edge from horizontal)
+    rotation_degrees = edge_rotation_degrees(mrr_xy_utm, long_edge)
+
+    return mrr_coords_wgs84, mrr_width, mrr_height, rotation_degrees, mrr.area
+
+
+concave_hull_indices = np.flatnonzero(has_concave_hull)
+rectangularity_results = [
+    analyze_rectangularity(concave_hulls_proj[i]) for i in concave_hull_indices
+]
+
+mrr_vertices = [None] * num_features
+mrr_widths = np.full(num_features, np.nan)
+mrr_heights = np.full(num_features, np.nan)
+mrr_rotations = np.full(num_features, np.nan)
+mrr_areas = np.full(num_features, np.nan)
+
+for i, (vertices, width, height, rotation, area) in zip(
+    concave_hull_indices, rectangularity_results
+):
+    mrr_vertices[i] = vertices
+    mrr_widths[i] = width
+    mrr_heights[i] = height
+    mrr_rotations[i] = rotation
+    mrr_areas[i] = area
+
+# Original multipolygon areas (NaN where missing)
+original_areas = np.array(
+    [feature["properties"].get("area_sqm") for feature in data["features"]],
+    dtype=float,
+)
+
+with np.errstate(divide="ignore", invalid="ignore"):
     # Rectangularity: ratio of concave hull area to MRR area
-    ch_area = concave_hull_proj.area
-    if mrr_area > 0:
-        rectangularity = ch_area / mrr_area
-        rectangularity_analysis["mrr_rectangularity"] = rectangularity
-    else:
-        rectangularity_analysis["mrr_rectangularity"] = None
+    mrr_rectangularity = np.where(mrr_areas > 0, ch_areas / mrr_areas, np.nan)
 
     # Ratio of original multipolygon area to MRR area
-    original_area = properties.get("area_sqm")
-    if original_area is not None and mrr_area > 0:
-        original_ratio = original_area / mrr_area
-        rectangularity_analysis["mrr_original_ratio"] = original_ratio
-    else:
-        rectangularity_analysis["mrr_original_ratio"] = None
-
-    # Store rectangularity analysis in properties
-    properties["rectangularity_analysis"] = rectangularity_analysis
+    mrr_original_ratios = np.where(mrr_areas > 0, original_areas / mrr_areas, np.nan)
 
 print(f"  Added rectangularity analysis fields:")
 print(f"    - mrr_vertices: Vertices of minimum rotated rectangle (WGS84)")
@@ -247,31 +216,17 @@ print(f"    - mrr_original_ratio: Ratio of original area to MRR area")
 
 print("\nCalculating triangularity analysis (Douglas-Peucker simplification)...")
 
-for feature in data["features"]:
-    properties = feature["properties"]
-
-    # Get the concave hull polygon
-    concave_hull_dict = properties.get("concave_hull_polygon")
-    if not concave_hull_dict:
-        # Skip if no concave hull
-        properties["triangularity_analysis"] = None
-        continue
-
-    # Initialize triangularity analysis dictionary
-    triangularity_analysis = {}
-
-    # Convert to shapely geometry
-    concave_hull = shape(concave_hull_dict)
-
-    # Project to UTM for accurate metric measurements
-    concave_hull_proj = transform(transformer.transform, concave_hull)
 
+def analyze_triangularity(concave_hull_proj):
+    """Douglas-Peucker triangle metrics of one concave hull (NaN where undefined)."""
     # Use binary search to find the Douglas-Peucker tolerance that gives exactly 3 vertices
-    # Start with a range of tolerances
+    # Start with a range of tolerances. No vertex can be farther than half the
+    # perimeter from any chord, so the perimeter always collapses the polygon
+    ch_perimeter = concave_hull_proj.length
     min_tolerance = 0.0
-    max_tolerance = concave_hull_proj.length * 2  # Use 2x perimeter as upper bound
+    max_tolerance = ch_perimeter
 
-    tolerance = 1.0  # Initial guess
+    tolerance = (min_tolerance + max_tolerance) / 2  # Initial guess
     simplified = None
     best_simplified = None
     best_vertex_count = float("inf")
@@ -288,8 +243,9 @@ for feature in data["features"]:
             )  # Exclude duplicate last point
         else:
             # If simplification resulted in non-polygon, tolerance is too high
-            max_tolerance = tolerance
-            tolerance = (min_tolerance + max_tolerance) / 2
+            tolerance, min_tolerance, max_tolerance = bisect_tolerance(
+                min_tolerance, max_tolerance, tolerance, 0
+            )
             continue
 
         # Track the best result (closest to 3 vertices)
@@ -301,17 +257,13 @@ for feature in data["features"]:
             # Found it!
             simplified = test_simplified
             break
-        elif num_vertices > 3:
-            # Need more simplification (higher tolerance)
-            min_tolerance = tolerance
-            tolerance = (min_tolerance + max_tolerance) / 2
-        else:  # num_vertices < 3
-            # Too much simplification (lower tolerance)
-            max_tolerance = tolerance
-            tolerance = (min_tolerance + max_tolerance) / 2
-
-        # Check if we've converged
-        if max_tolerance - min_tolerance < 0.00001:
+
+        tolerance, min_tolerance, max_tolerance = bisect_tolerance(
+            min_tolerance, max_tolerance, tolerance, num_vertices
+        )
+
+        # Check if we've converged (relative to the park's size)
+        if max_tolerance - min_tolerance < ch_perimeter * 1e-9:
             # Can't achieve exactly 3 vertices, use best approximation
             simplified = best_simplified
             break
@@ -322,78 +274,71 @@ for feature in data["features"]:
 
     if simplified is None or not isinstance(simplified, Polygon):
         # Couldn't simplify to triangle
-        triangularity_analysis["triangle_vertices"] = None
-        triangularity_analysis["triangle_area_sqm"] = None
-        triangularity_analysis["triangle_perimeter_m"] = None
-        triangularity_analysis["triangularity"] = None
-        triangularity_analysis["dp_tolerance"] = None
-        triangularity_analysis["triangle_edge_lengths"] = None
-        triangularity_analysis["triangle_num_vertices"] = None
-        triangularity_analysis["triangle_regularity"] = None
-        properties["triangularity_analysis"] = triangularity_analysis
-        continue
-
-    # Store the tolerance used
-    triangularity_analysis["dp_tolerance"] = tolerance
+        return np.nan, None, np.nan, np.nan, None, np.nan, np.nan
 
     # Get triangle vertices in UTM
     triangle_coords_utm = list(simplified.exterior.coords)[
         :-1
     ]  # Remove duplicate last point
 
-    # Transform vertices back to WGS84 for storage
-    transformer_inv = pyproj.Transformer.from_crs(
-        "EPSG:32618", "EPSG:4326", always_xy=True
+    # Transform vertices back to WGS84 for storage (all vertices in one call)
+    triangle_xy_utm = np.asarray(triangle_coords_utm, dtype=float).reshape(-1, 2)
+    triangle_lons, triangle_lats = transformer_inv.transform(
+        triangle_xy_utm[:, 0], triangle_xy_utm[:, 1]
     )
-    triangle_coords_wgs84 = [
-        list(transformer_inv.transform(x, y)) for x, y in triangle_coords_utm
-    ]
-    triangularity_analysis["triangle_vertices"] = triangle_coords_wgs84
-
-    # Calculate triangle area and perimeter
-    triangle_area = simplified.area
-    triangle_perimeter = simplified.length
-
-    triangularity_analysis["triangle_area_sqm"] = triangle_area
-    triangularity_analysis["triangle_perimeter_m"] = triangle_perimeter
-
-    # Triangularity: ratio of concave hull area to triangle area
-    ch_area = concave_hull_proj.area
-    if triangle_area > 0:
-        triangularity = ch_area / triangle_area
-        triangularity_analysis["triangularity"] = triangularity
-    else:
-        triangularity_analysis["triangularity"] = None
+    triangle_coords_wgs84 = np.column_stack((triangle_lons, triangle_lats)).tolist()
 
     # Calculate edge lengths
-    num_triangle_vertices = len(triangle_coords_utm)
-    if num_triangle_vertices >= 3:
-        edge_lengths = []
-        for i in range(num_triangle_vertices):
-            p1 = triangle_coords_utm[i]
-            p2 = triangle_coords_utm[(i + 1) % num_triangle_vertices]
-            length = math.sqrt((p2[0] - p1[0]) ** 2 + (p2[1] - p1[1]) ** 2)
-            edge_lengths.append(length)
-
-        triangularity_analysis["triangle_edge_lengths"] = edge_lengths
-        triangularity_analysis["triangle_num_vertices"] = num_triangle_vertices
+    num_triangle_vertices = len(triangle_coords_utm) if triangle_coords_utm else np.nan
+    edge_lengths = None
+    regularity = np.nan
+    if len(triangle_coords_utm) >= 3:
+        # Close the ring so every vertex is paired with the next one
+        edges = ring_edge_lengths(np.vstack((triangle_xy_utm, triangle_xy_utm[:1])))
+        edge_lengths = edges.tolist()
 
         # Triangle regularity: ratio of shortest to longest edge
         # Closer to 1 means more regular (equilateral = 1 for triangles)
-        if max(edge_lengths) > 0:
-            triangle_regularity = min(edge_lengths) / max(edge_lengths)
-            triangularity_analysis["triangle_regularity"] = triangle_regularity
-        else:
-            triangularity_analysis["triangle_regularity"] = None
-    else:
-        triangularity_analysis["triangle_edge_lengths"] = None
-        triangularity_analysis["triangle_num_vertices"] = (
-            num_triangle_vertices if triangle_coords_utm else None
-        )
-        triangularity_analysis["triangle_regularity"] = None
+        if edges.max() > 0:
+            regularity = edges.min() / edges.max()
+
+    return (
+        tolerance,
+        triangle_coords_wgs84,
+        simplified.area,
+        simplified.length,
+        edge_lengths,
+        num_triangle_vertices,
+        regularity,
+    )
 
-    # Store triangularity analysis in properties
-    properties["triangularity_analysis"] = triangularity_analysis
+
+triangularity_results = [
+    analyze_triangularity(concave_hulls_proj[i]) for i in concave_hull_indices
+]
+
+triangle_vertices = [None] * num_features
+triangle_edge_lengths = [None] * num_features
+triangle_num_vertices = np.full(num_features, np.nan)
+triangle_areas = np.full(num_features, np.nan)
+triangle_perimeters = np.full(num_features, np.nan)
+triangle_regularity = np.full(num_features, np.nan)
+dp_tolerances = np.full(num_features, np.nan)
+
+for i, result in zip(concave_hull_indices, triangularity_results):
+    (
+        dp_tolerances[i],
+        triangle_vertices[i],
+        triangle_areas[i],
+        triangle_perimeters[i],
+        triangle_edge_lengths[i],
+        triangle_num_vertices[i],
+        triangle_regularity[i],
+    ) = result
+
+with np.errstate(divide="ignore", invalid="ignore"):
+    # Triangularity: ratio of concave hull area to triangle area
+    triangularity = np.where(triangle_areas > 0, ch_areas / triangle_areas, np.nan)
 
 print(f"  Added triangularity analysis fields:")
 print(f"    - triangle_vertices: Vertices of simplified triangle (WGS84)")
@@ -405,10 +350,57 @@ print(f"    - dp_tolerance: Douglas-Peucker tolerance used for simplification")
 print(f"    - triangle_edge_lengths: Lengths of the triangle edges (m)")
 print(f"    - triangle_regularity: Ratio of shortest to longest edge")
 
+# MARK: Save Results
+
+# Attach the analysis arrays to each park's properties
+for i, feature in enumerate(data["features"]):
+    properties = feature["properties"]
+
+    if not has_concave_hull[i]:
+        properties["circle_analysis"] = None
+        properties["rectangularity_analysis"] = None
+        properties["triangularity_analysis"] = None
+        continue
+
+    properties["circle_analysis"] = {
+        "ch_area_sqm": float(ch_areas[i]),
+        "ch_perimeter_m": float(ch_perimeters[i]),
+        "polsby_popper": optional_float(polsby_popper[i]),
+        "schwartzberg": optional_float(schwartzberg[i]),
+        "reock_compactness": optional_float(reock_compactness[i]),
+        "circumscribed_circle_radius": optional_float(circumscribed_radii[i]),
+        "circumscribed_circle_area": optional_float(min_circle_areas[i]),
+    }
+
+    properties["rectangularity_analysis"] = {
+        "mrr_vertices": mrr_vertices[i],
+        "mrr_width": optional_float(mrr_widths[i]),
+        "mrr_height": optional_float(mrr_heights[i]),
+        "mrr_rotation_degrees": optional_float(mrr_rotations[i]),
+        "mrr_area_sqm": optional_float(mrr_areas[i]),
+        "mrr_rectangularity": optional_float(mrr_rectangularity[i]),
+        "mrr_original_ratio": optional_float(mrr_original_ratios[i]),
+    }
+
+    properties["triangularity_analysis"] = {
+        "dp_tolerance": optional_float(dp_tolerances[i]),
+        "triangle_vertices": triangle_vertices[i],
+        "triangle_area_sqm": optional_float(triangle_areas[i]),
+        "triangle_perimeter_m": optional_float(triangle_perimeters[i]),
+        "triangularity": optional_float(triangularity[i]),
+        "triangle_edge_lengths": triangle_edge_lengths[i],
+        "triangle_num_vertices": (
+            None
+            if np.isnan(triangle_num_vertices[i])
+            else int(triangle_num_vertices[i])
+        ),
+        "triangle_regularity": optional_float(triangle_regularity[i]),
+    }
+
 # Save the augmented data
 print("\nSaving analysis results...")
-with open(OUTPUT_DATA_FILE, "w") as f:
-    json.dump(data, f)
+with open(OUTPUT_DATA_FILE, "wb") as f:
+    f.write(orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY))
 
 print(f"Saved to: {OUTPUT_DATA_FILE}")
 print("\nDone!")